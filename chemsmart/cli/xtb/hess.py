@@ -21,7 +21,7 @@ def hess(ctx, skip_completed, **kwargs):
         ctx.obj["job_settings"], keywords=ctx.obj["keywords"]
     )
     check_charge_and_multiplicity(hess_settings)
-    logger.info(f"Final xTB hess settings: {hess_settings.__dict__}")
+    logger.info(f"Final xTB hess settings: {hess_settings.to_dict()}")
 
     from chemsmart.jobs.xtb.hess import XTBHessJob
 
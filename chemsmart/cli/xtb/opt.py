@@ -45,7 +45,7 @@ def opt(
     opt_settings = ctx.obj["project_settings"].opt_settings()
     opt_settings = opt_settings.merge(job_settings, keywords=tuple(keywords))
     check_charge_and_multiplicity(opt_settings)
-    logger.info(f"Final xTB opt settings: {opt_settings.__dict__}")
+    logger.info(f"Final xTB opt settings: {opt_settings.to_dict()}")
 
     from chemsmart.jobs.xtb.opt import XTBOptJob
 
@@ -21,7 +21,7 @@ def sp(ctx, skip_completed, **kwargs):
         ctx.obj["job_settings"], keywords=ctx.obj["keywords"]
     )
     check_charge_and_multiplicity(sp_settings)
-    logger.info(f"Final xTB sp settings: {sp_settings.__dict__}")
+    logger.info(f"Final xTB sp settings: {sp_settings.to_dict()}")
 
     from chemsmart.jobs.xtb.singlepoint import XTBSinglePointJob
 
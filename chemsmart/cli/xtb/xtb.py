@@ -234,7 +234,7 @@ def xtb(
         job_settings = XTBJobSettings.default()
         logger.info(
             f"No filename is supplied and xTB default settings are used:\n"
-            f"{job_settings.__dict__} "
+            f"{job_settings.to_dict()} "
         )
     elif filename.endswith((".com", ".gjf", ".inp", ".out", ".log")):
         job_settings = XTBJobSettings.from_filepath(filename)
@@ -393,7 +393,7 @@ def xtb(
             molecule_indices = [molecule_indices]
 
     logger.debug(f"xTB project settings: {project_settings}")
-    logger.debug(f"xTB job settings before merge: {job_settings.__dict__}")
+    logger.debug(f"xTB job settings before merge: {job_settings.to_dict()}")
     logger.debug(f"xTB merge keywords: {keywords}")
     logger.debug(f"xTB selected molecule count: {len(molecules)}")
     logger.debug(f"xTB selected molecule indices: {molecule_indices}")
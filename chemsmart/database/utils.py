@@ -11,6 +11,11 @@ import numpy as np
 
 from chemsmart.utils.repattern import route_split_pattern
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 SCHEMA_VERSION = 1
@@ -255,6 +260,12 @@ def from_json(json_str):
     """Parse JSON string, return None if input is None."""
     if json_str is None:
         return None
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which json.dumps writes but orjson rejects
+            pass
     return json.loads(json_str)
 
 
@@ -21,17 +21,24 @@ class DatabaseFile(FileMixin):
 
         vibrational_modes = struct_dict.get("vibrational_modes")
         if vibrational_modes is not None:
-            vibrational_modes = [np.array(mode) for mode in vibrational_modes]
+            vibrational_modes = [
+                np.asarray(mode, dtype=np.float64)
+                for mode in vibrational_modes
+            ]
         positions = struct_dict.get("positions")
         return Molecule(
             symbols=struct_dict.get("chemical_symbols"),
-            positions=(np.array(positions) if positions is not None else None),
+            positions=(
+                np.asarray(positions, dtype=np.float64)
+                if positions is not None
+                else None
+            ),
             charge=struct_dict.get("charge"),
             multiplicity=struct_dict.get("multiplicity"),
             frozen_atoms=struct_dict.get("frozen_atoms"),
             energy=struct_dict.get("energy"),
             forces=(
-                np.array(struct_dict["forces"])
+                np.asarray(struct_dict["forces"], dtype=np.float64)
                 if struct_dict.get("forces")
                 else None
             ),
@@ -26,6 +26,9 @@ p = pt()
 
 logger = logging.getLogger(__name__)
 
+# One coordinate row: symbol padded to 5, then x/y/z as 15.10f.
+_COORDINATE_ROW_FORMAT = "%-5s %15.10f %15.10f %15.10f\n"
+
 
 class Molecule:
     """Class to represent a molcular structure.
@@ -1318,6 +1321,7 @@ class Molecule:
         )
 
     @classmethod
+    @file_cache()
     def _read_chemsmart_dbfile(
         cls,
         filepath,
@@ -1601,22 +1605,51 @@ class Molecule:
             mode (str): File write mode
             **kwargs: Additional keyword arguments (unused)
         """
+        # Render the whole record first and emit it with a single write.
+        record = self._format_xyz_record(filename)
+        logger.info(f"Writing outputfile to {filename}")
         with open(filename, mode) as f:
-            base_filename = os.path.basename(filename)
-            if self.energy is not None:
-                # energy found in file, e.g., .out, .log
-                xyz_info = (
-                    f"{base_filename}    Empirical formula: {self.chemical_formula}    "
-                    f"Energy(Hartree): {self.energy:.6f}    "
-                )
-            else:
-                # no energy found in file, e.g., .xyz or .com
-                xyz_info = f"{base_filename}    Empirical formula: {self.chemical_formula}"
+            f.write(record)
 
-            logger.info(f"Writing outputfile to {filename}")
-            f.write(f"{self.num_atoms}\n")
-            f.write(f"{xyz_info}\n")
-            self._write_orca_coordinates(f)
+    @classmethod
+    def write_xyz_frames(cls, molecules, filename, mode="w"):
+        """
+        Write several molecules as consecutive frames of one XYZ file.
+
+        All frames are rendered up front and written in a single call,
+        instead of reopening the file once per molecule.
+
+        Args:
+            molecules (list[Molecule]): Molecules to write, in order
+            filename (str): Output XYZ file path
+            mode (str): File write mode. Default 'w'
+        """
+        records = "".join(
+            molecule._format_xyz_record(filename) for molecule in molecules
+        )
+        logger.info(f"Writing {len(molecules)} frames to {filename}")
+        with open(filename, mode) as f:
+            f.write(records)
+
+    def _format_xyz_record(self, filename):
+        """
+        Return one XYZ record (count, comment and coordinates) as a string.
+        """
+        base_filename = os.path.basename(filename)
+        if self.energy is not None:
+            # energy found in file, e.g., .out, .log
+            xyz_info = (
+                f"{base_filename}    Empirical formula: {self.chemical_formula}    "
+                f"Energy(Hartree): {self.energy:.6f}    "
+            )
+        else:
+            # no energy found in file, e.g., .xyz or .com
+            xyz_info = f"{base_filename}    Empirical formula: {self.chemical_formula}"
+
+        return (
+            f"{self.num_atoms}\n{xyz_info}\n"
+            f"{self._format_orca_coordinates()}"
+        )
 
     def write_extxyz(self, filename, mode="w", **kwargs):
         """Write molecule to extended-XYZ format file.
@@ -1872,6 +1905,12 @@ class Molecule:
         """
         Write coordinates in ORCA format.
         """
+        f.write(self._format_orca_coordinates())
+
+    def _format_orca_coordinates(self):
+        """
+        Return the coordinate block in ORCA format as a single string.
+        """
         assert self.symbols is not None, "Symbols to write should not be None!"
         assert (
             self.positions is not None
@@ -1880,10 +1919,14 @@ class Molecule:
         # if self.frozen_atoms is None:
         # commented above out since with frozen atom
         # or not, the geometry is written the same way
-        for i, (s, (x, y, z)) in enumerate(
-            zip(self.chemical_symbols, self.positions)
-        ):
-            f.write(f"{s:5} {x:15.10f} {y:15.10f} {z:15.10f}\n")
+        # plain floats format faster than numpy scalars
+        positions = np.asarray(self.positions).tolist()
+        return "".join(
+            [
+                _COORDINATE_ROW_FORMAT % (s, x, y, z)
+                for s, (x, y, z) in zip(self.chemical_symbols, positions)
+            ]
+        )
 
     def _write_orca_pbc_coordinates(self, f):
         """
@@ -80,39 +80,37 @@ class XYZFile(FileMixin):
         """
         from chemsmart.io.molecules.structure import Molecule
 
-        all_molecules = []
-        comments = []
+        # First pass: locate each frame without parsing its coordinates.
+        # Each entry is (1-based frame index, comment, block start, num_atoms)
+        frames = []
         i = 0
-        frame_idx = 0  # frame counter across the entire file (assigned to molecules as 1-based)
         while i < len(self.contents):
             # Read number of atoms
             num_atoms = int(self.contents[i].strip())
             if num_atoms == 0:
                 raise ValueError("Number of atoms in the xyz file is zero!")
-            i += 1
-            # Read comment line
-            comment = self.contents[i].strip()
-            comments.append(comment)
-            i += 1
-            # Read the coordinate block
-            coordinate_block = self.contents[i : i + num_atoms]
-            i += num_atoms
-
-            # Assign frame index (1-based) where the structure appears in file
-            frame_idx += 1
-            molecule = Molecule.from_coordinate_block_text(
-                coordinate_block, structure_index_in_file=frame_idx
+            comment = self.contents[i + 1].strip()
+            frames.append((len(frames) + 1, comment, i + 2, num_atoms))
+            i += num_atoms + 2
+
+        # Only build Molecule objects for the requested frames, so reading
+        # e.g. the last structure of a long trajectory parses one block.
+        selected = frames[string2index_1based(index)]
+        single = not isinstance(selected, list)
+        if single:
+            selected = [selected]
+
+        molecules = [
+            Molecule.from_coordinate_block_text(
+                self.contents[block_start : block_start + num_atoms],
+                structure_index_in_file=frame_idx,
             )
-
-            # Store the molecule data
-            all_molecules.append(molecule)
-
-        molecules = all_molecules[string2index_1based(index)]
-        comments = comments[string2index_1based(index)]
-        if return_list and not isinstance(molecules, list):
-            return [molecules], [comments]
-        else:
-            return molecules, comments
+            for frame_idx, _, block_start, num_atoms in selected
+        ]
+        comments = [comment for _, comment, _, _ in selected]
+        if single and not return_list:
+            return molecules[0], comments[0]
+        return molecules, comments
 
     def get_molecules(self, index=":", return_list=False):
         """
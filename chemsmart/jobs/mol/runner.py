@@ -378,8 +378,7 @@ class PyMOLJobRunner(JobRunner):
                     logger.info(
                         f"Writing list of molecules: {mol} to {job.inputfile}"
                     )
-                    for m in mol:
-                        m.write(job.inputfile, format="xyz", mode="a")
+                    Molecule.write_xyz_frames(mol, job.inputfile, mode="a")
                 else:
                     raise ValueError(
                         f"Object {mol[0]} is not of Molecule type!"
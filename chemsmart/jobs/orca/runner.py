@@ -23,11 +23,14 @@ from chemsmart.settings.executable import ORCAExecutable
 from chemsmart.utils.periodictable import PeriodicTable
 from chemsmart.utils.repattern import (
     allxyz_filename_pattern,
+    orca_tmp_filename_pattern,
     solventfilename_block_pattern,
 )
 
 pt = PeriodicTable()
 
+_ORCA_TMP_FILE_RE = re.compile(orca_tmp_filename_pattern)
+
 logger = logging.getLogger(__name__)
 
 
@@ -443,9 +446,9 @@ class ORCAJobRunner(JobRunner):
         if self.scratch:
             logger.debug(f"Running directory: {self.running_directory}")
             # if job was run in scratch, copy files to
-            # job folder except files containing .tmp
+            # job folder except .tmp and .tmp.* files
             for file in glob(f"{self.running_directory}/{job.label}*"):
-                if not file.endswith((".tmp", ".tmp.*")):
+                if not _ORCA_TMP_FILE_RE.search(file):
                     logger.info(
                         f"Copying file {file} from {self.running_directory} "
                         f"to {job.folder}"
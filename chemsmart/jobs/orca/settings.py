@@ -421,19 +421,19 @@ class ORCAJobSettings(MolecularJobSettings):
             ORCAJobSettings or None: Settings object if file type supported
         """
 
-        if ".com" in filepath or ".gjf" in filepath:
+        if filepath.endswith((".com", ".gjf")):
             return cls.from_comfile(filepath)
 
-        if ".log" in filepath:
+        if filepath.endswith(".log"):
             return cls.from_logfile(filepath)
 
-        if ".inp" in filepath:
+        if filepath.endswith(".inp"):
             return cls.from_inpfile(filepath)
 
-        if ".out" in filepath:
+        if filepath.endswith(".out"):
             return cls.from_outfile(filepath)
 
-        if ".xyz" in filepath:
+        if filepath.endswith(".xyz"):
             return cls.from_xyzfile()
 
         return None
@@ -250,7 +250,7 @@ def read_molecular_job_yaml(filename, program="gaussian"):
         elif program == "xtb":
             from chemsmart.jobs.xtb.settings import XTBJobSettings
 
-            default_config = XTBJobSettings.default().__dict__
+            default_config = XTBJobSettings.default().to_dict()
         else:
             # other programs may be implemented in future
             pass
@@ -1,8 +1,8 @@
 import logging
 import os
 import subprocess
-from contextlib import suppress
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from glob import glob
 from shutil import copy
 
@@ -11,6 +11,15 @@ from chemsmart.settings.executable import XTBExecutable
 
 logger = logging.getLogger(__name__)
 
+_FAKE_XTB_SEPARATOR = "-" * 60
+_FAKE_XTB_OUTPUT_TEMPLATE = (
+    f"{_FAKE_XTB_SEPARATOR}\n"
+    "* xtb version 0.0.0 (Fake)\n"
+    "program call               : {command}\n"
+    f"{_FAKE_XTB_SEPARATOR}\n"
+    "* finished run (fake xtb)\n"
+)
+
 
 class XTBJobRunner(JobRunner):
     """Job runner for xTB command-line calculations."""
@@ -41,8 +50,7 @@ class XTBJobRunner(JobRunner):
         logger.debug(f"xTB jobrunner scratch: {self.scratch}")
         logger.debug(f"xTB jobrunner delete_scratch: {self.delete_scratch}")
 
-    @property
-    @lru_cache(maxsize=12)
+    @cached_property
     def executable(self):
         try:
             logger.info(
@@ -79,17 +87,13 @@ class XTBJobRunner(JobRunner):
         logger.debug(f"xTB error path: {self.job_errfile}")
 
     def _set_up_variables_in_scratch(self, job):
-        scratch_job_dir = os.path.join(self.scratch_dir, job.label)
-        if not os.path.exists(scratch_job_dir):
-            with suppress(FileExistsError):
-                os.makedirs(scratch_job_dir)
-        self.running_directory = scratch_job_dir
-        self.job_xyzfile = os.path.abspath(
-            os.path.join(scratch_job_dir, f"{job.label}.xyz")
-        )
-        self.job_inputfile = os.path.abspath(
-            os.path.join(scratch_job_dir, f"{job.label}.inp")
+        scratch_job_dir = os.path.abspath(
+            os.path.join(self.scratch_dir, job.label)
         )
+        os.makedirs(scratch_job_dir, exist_ok=True)
+        self.running_directory = scratch_job_dir
+        self.job_xyzfile = os.path.join(scratch_job_dir, f"{job.label}.xyz")
+        self.job_inputfile = os.path.join(scratch_job_dir, f"{job.label}.inp")
         self.job_errfile = os.path.abspath(job.errfile)
 
     def _set_up_variables_in_job_directory(self, job):
@@ -108,54 +112,28 @@ class XTBJobRunner(JobRunner):
             input_writer = XTBInputWriter(job=job)
             input_writer.write(target_directory=self.running_directory)
 
+    @cached_property
+    def _executable_path(self):
+        # The executable is fixed for the runner's lifetime, so resolve it
+        # once rather than for every job in a batch.
+        return self.executable.get_executable()
+
     def _get_command(self, job):
-        executable = self.executable.get_executable()
-        command = [executable, self.job_xyzfile]
-        command.extend(self.get_settings_args(job.settings))
+        command = [
+            self._executable_path,
+            self.job_xyzfile,
+            *self.get_settings_args(job.settings),
+        ]
         logger.debug(f"Generated xTB command: {command}")
         return command
 
     def get_settings_args(self, settings):
         # Keep command rendering centralized so run/sub/fake paths cannot drift
         # when new xTB flags or jobtypes are added.
-        args = []
-        args.extend(self._gfn_args(settings.gfn_version))
-
-        if settings.jobtype == "opt":
-            opt_flag = "--ohess" if settings.freq else "--opt"
-            args.append(opt_flag)
-            if settings.optimization_level is not None:
-                args.append(settings.optimization_level)
-        elif settings.jobtype == "hess":
-            args.append("--hess")
-        elif settings.jobtype != "sp":
-            raise ValueError(f"Unsupported xTB jobtype: {settings.jobtype}")
-
-        args.extend(["--chrg", str(settings.charge)])
-        args.extend(["--uhf", str(settings.multiplicity - 1)])
-
-        if (
-            settings.solvent_model is not None
-            and settings.solvent_id is not None
-        ):
-            args.extend([f"--{settings.solvent_model}", settings.solvent_id])
-        if settings.grad:
-            args.append("--grad")
+        input_filename = None
         if settings.constraints:
-            args.extend(["--input", os.path.basename(self.job_inputfile)])
-        if settings.additional_flags is not None:
-            args.extend(settings.additional_flags.split())
-        return args
-
-    @staticmethod
-    def _gfn_args(gfn_version):
-        if gfn_version is None:
-            return []
-        if gfn_version.startswith("gfn") and gfn_version[-1].isdigit():
-            return ["--gfn", gfn_version[-1]]
-        if gfn_version == "gfnff":
-            return ["--gfnff"]
-        return [f"--{gfn_version}"]
+            input_filename = os.path.basename(self.job_inputfile)
+        return settings.get_command_args(input_filename=input_filename)
 
     def _create_process(self, job, command, env):
         logger.info(
@@ -177,18 +155,94 @@ class XTBJobRunner(JobRunner):
             )
 
     def _postrun(self, job, **kwargs):
+        # Scratch files that could not be brought back to the job folder;
+        # while any remain, the scratch directory is not deleted.
+        self._unretrieved_scratch_files = []
         if not self.scratch:
             return
         logger.debug(
             f"Copying xTB scratch files from: {self.running_directory}"
         )
-        for filepath in glob(os.path.join(self.running_directory, "*")):
-            destination = os.path.join(job.folder, os.path.basename(filepath))
-            if os.path.abspath(filepath) == os.path.abspath(destination):
-                continue
-            logger.info(f"Copying xTB file {filepath} to {job.folder}")
-            with suppress(IsADirectoryError):
-                copy(filepath, job.folder)
+        # Every destination is job.folder/<basename>, so a file can only
+        # be copied onto itself when the two directories coincide.
+        if os.path.realpath(self.running_directory) == os.path.realpath(
+            job.folder
+        ):
+            return
+        files_to_copy = [
+            filepath
+            for filepath in glob(os.path.join(self.running_directory, "*"))
+            if os.path.isfile(filepath)
+        ]
+        if not files_to_copy:
+            return
+        if not os.access(job.folder, os.W_OK):
+            logger.error(
+                f"Job folder {job.folder} is not writable, "
+                f"xTB scratch files are left in {self.running_directory}"
+            )
+            self._unretrieved_scratch_files = files_to_copy
+            return
+        # Scratch that is deleted after the job can hand its files over with
+        # a rename on the same filesystem. Otherwise keep independent copies,
+        # so later writes into a surviving scratch folder (e.g. a rerun with
+        # the same label) cannot change the results in the job folder.
+        move = (
+            self.delete_scratch
+            and os.stat(self.running_directory).st_dev
+            == os.stat(job.folder).st_dev
+        )
+        # Copies are independent and I/O-bound (scratch usually sits on a
+        # different filesystem), so overlap them instead of copying serially.
+        # Failures are collected from the futures so one bad file does not
+        # stop the others.
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(files_to_copy))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._copy_file_to_job_folder,
+                    filepath,
+                    job.folder,
+                    move=move,
+                ): filepath
+                for filepath in files_to_copy
+            }
+        for future, filepath in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                logger.error(
+                    f"Failed to copy xTB file {filepath} to {job.folder}: "
+                    f"{exc}"
+                )
+                self._unretrieved_scratch_files.append(filepath)
+
+    def _delete_scratch_directory(self):
+        unretrieved = getattr(self, "_unretrieved_scratch_files", None)
+        if unretrieved:
+            logger.error(
+                f"Keeping xTB scratch directory {self.running_directory}: "
+                f"{len(unretrieved)} file(s) were not copied to the job "
+                f"folder."
+            )
+            return
+        super()._delete_scratch_directory()
+
+    @staticmethod
+    def _copy_file_to_job_folder(filepath, folder, move=False):
+        if move:
+            destination = os.path.join(folder, os.path.basename(filepath))
+            logger.info(f"Moving xTB file {filepath} to {folder}")
+            try:
+                os.replace(filepath, destination)
+                return
+            except OSError as e:
+                logger.debug(
+                    f"Could not move {filepath} to {destination}, "
+                    f"falling back to copy: {e}"
+                )
+        logger.info(f"Copying xTB file {filepath} to {folder}")
+        copy(filepath, folder)
 
 
 class FakeXTBJobRunner(XTBJobRunner):
@@ -199,24 +253,19 @@ class FakeXTBJobRunner(XTBJobRunner):
     def __init__(self, server, scratch=None, fake=True, **kwargs):
         super().__init__(server=server, scratch=scratch, fake=fake, **kwargs)
 
-    @property
-    @lru_cache(maxsize=12)
+    @cached_property
     def executable(self):
         return XTBExecutable(executable_folder=None, local_run=True)
 
     def _set_up_variables_in_scratch(self, job):
-        scratch_job_dir = os.path.join(self.scratch_dir, job.label)
-        if not os.path.exists(scratch_job_dir):
-            with suppress(FileExistsError):
-                os.makedirs(scratch_job_dir)
+        scratch_job_dir = os.path.abspath(
+            os.path.join(self.scratch_dir, job.label)
+        )
+        os.makedirs(scratch_job_dir, exist_ok=True)
         self.running_directory = scratch_job_dir
         self._append_suffix_to_job_label(job, "_fake")
-        self.job_xyzfile = os.path.abspath(
-            os.path.join(scratch_job_dir, f"{job.label}.xyz")
-        )
-        self.job_inputfile = os.path.abspath(
-            os.path.join(scratch_job_dir, f"{job.label}.inp")
-        )
+        self.job_xyzfile = os.path.join(scratch_job_dir, f"{job.label}.xyz")
+        self.job_inputfile = os.path.join(scratch_job_dir, f"{job.label}.inp")
         self.job_outputfile = os.path.abspath(job.outputfile)
         self.job_errfile = os.path.abspath(job.errfile)
 
@@ -259,16 +308,10 @@ class FakeXTB:
             raise FileNotFoundError(f"File {self.xyzfile} not found.")
         with open(self.outputfile, "w") as out:
             out.write(
-                "------------------------------------------------------------\n"
-            )
-            out.write("* xtb version 0.0.0 (Fake)\n")
-            out.write(
-                f"program call               : {' '.join(self.command)}\n"
-            )
-            out.write(
-                "------------------------------------------------------------\n"
+                _FAKE_XTB_OUTPUT_TEMPLATE.format(
+                    command=" ".join(self.command)
+                )
             )
-            out.write("* finished run (fake xtb)\n")
         with open(self.errfile, "w") as err:
             err.write("")
         return 0
@@ -1,6 +1,6 @@
-import copy
 import logging
 import os
+from functools import lru_cache
 
 from chemsmart.io.xtb import (
     XTB_ALL_JOB_TYPES,
@@ -12,10 +12,88 @@ from chemsmart.io.xtb import (
 
 logger = logging.getLogger(__name__)
 
+# Membership-only views of the xTB reference lists, built once at import.
+_KNOWN_METHODS = frozenset(XTB_ALL_METHODS)
+_KNOWN_OPT_LEVELS = frozenset(XTB_ALL_OPT_LEVELS)
+_KNOWN_JOB_TYPES = frozenset(XTB_ALL_JOB_TYPES)
+_KNOWN_SOLVENT_MODELS = frozenset(XTB_ALL_SOLVENT_MODELS)
+_KNOWN_SOLVENT_IDS = frozenset(XTB_ALL_SOLVENT_IDS)
+
+
+def _gfn_args(gfn_version):
+    if gfn_version is None:
+        return ()
+    if gfn_version.startswith("gfn") and gfn_version[-1].isdigit():
+        return ("--gfn", gfn_version[-1])
+    if gfn_version == "gfnff":
+        return ("--gfnff",)
+    return (f"--{gfn_version}",)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _build_command_args(
+    gfn_version,
+    jobtype,
+    freq,
+    optimization_level,
+    charge,
+    multiplicity,
+    solvent_model,
+    solvent_id,
+    grad,
+    input_filename,
+    additional_flags,
+):
+    """Render the xTB command-line flags for one set of settings values.
+
+    Cached on the argument values, so batches of jobs sharing the same
+    settings build their flags once.
+    """
+    args = list(_gfn_args(gfn_version))
+    extend = args.extend
+
+    if jobtype == "opt":
+        args.append("--ohess" if freq else "--opt")
+        if optimization_level is not None:
+            args.append(optimization_level)
+    elif jobtype == "hess":
+        args.append("--hess")
+    elif jobtype != "sp":
+        raise ValueError(f"Unsupported xTB jobtype: {jobtype}")
+
+    extend(("--chrg", str(charge), "--uhf", str(multiplicity - 1)))
+
+    if solvent_model is not None and solvent_id is not None:
+        extend((f"--{solvent_model}", solvent_id))
+    if grad:
+        args.append("--grad")
+    if input_filename is not None:
+        extend(("--input", input_filename))
+    if additional_flags is not None:
+        extend(additional_flags.split())
+    return tuple(args)
+
 
 class XTBJobSettings:
     """Settings for xTB command-line jobs."""
 
+    __slots__ = (
+        "gfn_version",
+        "optimization_level",
+        "charge",
+        "multiplicity",
+        "jobtype",
+        "title",
+        "freq",
+        "grad",
+        "solvent_model",
+        "solvent_id",
+        "constraints",
+        "force_constant",
+        "input_string",
+        "additional_flags",
+    )
+
     def __init__(
         self,
         gfn_version="gfn2",
@@ -45,15 +123,27 @@ class XTBJobSettings:
         if solvent_id is not None:
             solvent_id = solvent_id.lower()
 
-        self._warn_if_unknown(gfn_version, XTB_ALL_METHODS, "GFN version")
         self._warn_if_unknown(
-            optimization_level, XTB_ALL_OPT_LEVELS, "optimization level"
+            gfn_version, _KNOWN_METHODS, "GFN version", XTB_ALL_METHODS
+        )
+        self._warn_if_unknown(
+            optimization_level,
+            _KNOWN_OPT_LEVELS,
+            "optimization level",
+            XTB_ALL_OPT_LEVELS,
+        )
+        self._warn_if_unknown(
+            jobtype, _KNOWN_JOB_TYPES, "job type", XTB_ALL_JOB_TYPES
+        )
+        self._warn_if_unknown(
+            solvent_model,
+            _KNOWN_SOLVENT_MODELS,
+            "solvent model",
+            XTB_ALL_SOLVENT_MODELS,
         )
-        self._warn_if_unknown(jobtype, XTB_ALL_JOB_TYPES, "job type")
         self._warn_if_unknown(
-            solvent_model, XTB_ALL_SOLVENT_MODELS, "solvent model"
+            solvent_id, _KNOWN_SOLVENT_IDS, "solvent id", XTB_ALL_SOLVENT_IDS
         )
-        self._warn_if_unknown(solvent_id, XTB_ALL_SOLVENT_IDS, "solvent id")
 
         self.gfn_version = gfn_version
         self.optimization_level = optimization_level
@@ -71,15 +161,24 @@ class XTBJobSettings:
         self.additional_flags = additional_flags
 
     @staticmethod
-    def _warn_if_unknown(value, known_values, label):
+    def _warn_if_unknown(value, known_values, label, listed_values):
+        # known_values is only used for membership; the message lists the
+        # reference values in their original (meaningful) order.
         if value is not None and value not in known_values:
             logger.warning(
                 f"{label} {value!r} is not in the known xTB values: "
-                f"{known_values}"
+                f"{listed_values}"
             )
 
     @classmethod
     def default(cls):
+        # Hand out copies of one validated template per class, so callers
+        # may mutate the result without re-running __init__ each time.
+        return cls._default_template().copy()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _default_template(cls):
         return cls()
 
     @classmethod
@@ -167,7 +266,7 @@ class XTBJobSettings:
         method = meta.get("method")
         if method is not None:
             method_lower = str(method).lower()
-            if method_lower in XTB_ALL_METHODS:
+            if method_lower in _KNOWN_METHODS:
                 settings.gfn_version = method_lower
         settings.solvent_model = meta.get("solvent_model")
         settings.solvent_id = meta.get("solvent_id")
@@ -183,7 +282,15 @@ class XTBJobSettings:
         return settings
 
     def copy(self):
-        return copy.deepcopy(self)
+        # All fields are immutable scalars except the constraint index lists,
+        # so copy those explicitly instead of paying for copy.deepcopy and
+        # without re-running the __init__ validation.
+        new = object.__new__(type(self))
+        for name in XTBJobSettings.__slots__:
+            setattr(new, name, getattr(self, name))
+        if self.constraints is not None:
+            new.constraints = [list(atoms) for atoms in self.constraints]
+        return new
 
     def merge(
         self,
@@ -191,39 +298,100 @@ class XTBJobSettings:
         keywords=("charge", "multiplicity", "title"),
         merge_all=False,
     ):
-        other_dict = other if isinstance(other, dict) else other.__dict__
+        if isinstance(other, XTBJobSettings):
+            return self._merge_settings(other, keywords, merge_all)
+        if isinstance(other, dict):
+            other_dict = other
+        else:
+            other_dict = other.__dict__
+        merged_dict = self.to_dict()
         if merge_all:
-            merged_dict = self.__dict__.copy()
             merged_dict.update(other_dict)
             logger.debug(f"Merged all xTB settings: {merged_dict}")
             return type(self)(**merged_dict)
 
-        if keywords is not None:
-            other_dict = {
-                key: other_dict[key] for key in keywords if key in other_dict
-            }
-        merged_dict = self.__dict__.copy()
-        merged_dict.update(other_dict)
+        if keywords is None:
+            merged_dict.update(other_dict)
+        else:
+            for key in keywords:
+                if key in other_dict:
+                    merged_dict[key] = other_dict[key]
         logger.debug(
             f"Merged xTB settings with keywords {keywords}: {merged_dict}"
         )
         return type(self)(**merged_dict)
 
+    def _merge_settings(self, other, keywords, merge_all):
+        # Both sides were already normalised and validated by __init__, so
+        # update a copy in place rather than rebuilding from a merged dict.
+        if merge_all or keywords is None:
+            keys = XTBJobSettings.__slots__
+        else:
+            keys = [key for key in keywords if key in XTBJobSettings.__slots__]
+        merged = self.copy()
+        for key in keys:
+            setattr(merged, key, getattr(other, key))
+        if "constraints" in keys and other.constraints is not None:
+            merged.constraints = [list(atoms) for atoms in other.constraints]
+        logger.debug(
+            f"Merged xTB settings with keywords "
+            f"{None if merge_all else keywords}: {merged.to_dict()}"
+        )
+        return merged
+
+    def to_dict(self):
+        """Return the settings as a ``{field: value}`` dictionary."""
+        return {name: getattr(self, name) for name in XTBJobSettings.__slots__}
+
+    def get_command_args(self, input_filename=None):
+        """Return the xTB command-line flags for these settings.
+
+        Args:
+            input_filename (str, optional): Name of the xcontrol file passed
+                with ``--input`` (used for constrained jobs).
+
+        Returns:
+            list: Flags to append after the geometry file.
+        """
+        return list(
+            _build_command_args(
+                self.gfn_version,
+                self.jobtype,
+                self.freq,
+                self.optimization_level,
+                self.charge,
+                self.multiplicity,
+                self.solvent_model,
+                self.solvent_id,
+                self.grad,
+                input_filename,
+                self.additional_flags,
+            )
+        )
+
     def remove_solvent(self):
         self.solvent_model = None
         self.solvent_id = None
 
     def update_solvent(self, solvent_model=None, solvent_id=None):
         if solvent_model is not None:
+            solvent_model = solvent_model.lower()
             self._warn_if_unknown(
-                solvent_model.lower(), XTB_ALL_SOLVENT_MODELS, "solvent model"
+                solvent_model,
+                _KNOWN_SOLVENT_MODELS,
+                "solvent model",
+                XTB_ALL_SOLVENT_MODELS,
             )
-            self.solvent_model = solvent_model.lower()
+            self.solvent_model = solvent_model
         if solvent_id is not None:
+            solvent_id = solvent_id.lower()
             self._warn_if_unknown(
-                solvent_id.lower(), XTB_ALL_SOLVENT_IDS, "solvent id"
+                solvent_id,
+                _KNOWN_SOLVENT_IDS,
+                "solvent id",
+                XTB_ALL_SOLVENT_IDS,
             )
-            self.solvent_id = solvent_id.lower()
+            self.solvent_id = solvent_id
 
     def modify_solvent(self, remove_solvent=False, **kwargs):
         if remove_solvent:
@@ -309,7 +477,22 @@ class XTBJobSettings:
             )
         return cls.default()
 
+    def _key(self):
+        """Return the field values as a hashable tuple."""
+        constraints = self.constraints
+        if constraints is not None:
+            constraints = tuple(tuple(atoms) for atoms in constraints)
+        return tuple(
+            constraints if name == "constraints" else getattr(self, name)
+            for name in XTBJobSettings.__slots__
+        )
+
     def __eq__(self, other):
         if type(self) is not type(other):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return self._key() == other._key()
+
+    def __hash__(self):
+        # Hash follows the current field values; do not mutate settings
+        # while they are used as dict keys or set members.
+        return hash(self._key())
@@ -92,25 +92,29 @@ class XTBInputWriter(InputWriter):
                         f"Atom index {idx} out of range [1, {n_atoms}]."
                     )
 
-        f.write("$constrain\n")
+        lines = ["$constrain\n"]
         if force_constant is not None:
-            f.write(f"   force constant={force_constant}\n")
+            lines.append(f"   force constant={force_constant}\n")
 
         for atoms in constraints:
             if len(atoms) == 2:
                 idx1, idx2 = atoms
                 distance = molecule.get_distance(idx1, idx2)
-                f.write(f"   distance: {idx1}, {idx2}, {distance:.4f}\n")
+                lines.append(f"   distance: {idx1}, {idx2}, {distance:.4f}\n")
             elif len(atoms) == 3:
                 idx1, idx2, idx3 = atoms
                 angle = molecule.get_angle(idx1, idx2, idx3)
-                f.write(f"   angle: {idx1}, {idx2}, {idx3}, {angle:.4f}\n")
+                lines.append(
+                    f"   angle: {idx1}, {idx2}, {idx3}, {angle:.4f}\n"
+                )
             elif len(atoms) == 4:
                 idx1, idx2, idx3, idx4 = atoms
                 dihedral = molecule.get_dihedral(idx1, idx2, idx3, idx4)
-                f.write(
+                lines.append(
                     f"   dihedral: {idx1}, {idx2}, {idx3}, {idx4}, "
                     f"{dihedral:.4f}\n"
                 )
 
-        f.write("$end\n")
+        lines.append("$end\n")
+        # Emit the whole block with a single write call.
+        f.write("".join(lines))
@@ -10,6 +10,7 @@ import logging
 import os
 
 import click
+import numpy as np
 
 from chemsmart.cli.logger import logger_options
 from chemsmart.io.gaussian.output import Gaussian16Output
@@ -18,7 +19,6 @@ from chemsmart.utils.io import get_program_type_from_file
 from chemsmart.utils.logger import create_logger
 
 logger = logging.getLogger(__name__)
-os.environ["OMP_NUM_THREADS"] = "1"
 
 
 @click.command()
@@ -44,6 +44,9 @@ def entry_point(filename, unit, debug, stream):
 
     Supports both closed-shell and open-shell systems.
     """
+    # Single-threaded BLAS for the CLI only, so importing this module does
+    # not change threading for other callers; respect a user override.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
     create_logger()
     program = get_program_type_from_file(filename)
     if program == "gaussian":
@@ -192,8 +195,10 @@ def entry_point(filename, unit, debug, stream):
             logger.info(
                 f"Number of unpaired electrons: {outputfile.num_unpaired_electrons}"
             )
-            somo = [e * conversion_factor for e in somo_energies]
-            for i, energy in enumerate(somo, 1):
+            # convert all SOMO energies in one array operation
+            somo = np.asarray(somo_energies, dtype=np.float64)
+            somo *= conversion_factor
+            for i, energy in enumerate(somo.tolist(), 1):
                 logger.info(f"SOMO-{i} energy: {energy:.4f} {energy_unit}")
 
             if lowest_somo is not None:
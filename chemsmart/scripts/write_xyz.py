@@ -64,10 +64,12 @@ def entry_point(filename, index, single_file):
         molecules[0].write_xyz(file_basename + "_single.xyz")
     else:
         # Handle multiple structures
-        for i, molecule in enumerate(molecules):
-            if single_file:
-                molecule.write_xyz(file_basename + "_all.xyz", mode="a")
-            else:
+        if single_file:
+            Molecule.write_xyz_frames(
+                molecules, file_basename + "_all.xyz", mode="a"
+            )
+        else:
+            for i, molecule in enumerate(molecules):
                 molecule.write_xyz(file_basename + f"_{i+1}.xyz")
 
 
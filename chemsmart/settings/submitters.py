@@ -1,6 +1,7 @@
 import inspect
 import logging
 from abc import abstractmethod
+from functools import cached_property
 from typing import Optional
 
 from chemsmart.settings.executable import (
@@ -242,11 +243,14 @@ class Submitter(RegistryMixin):
             return f"chemsmart_run_{self.job.label}.py"
         return "chemsmart_run.py"
 
-    @property
+    @cached_property
     def executable(self):
         """
         Get the executable configuration for the job's program.
 
+        Cached per submitter, since building it reads the server YAML
+        and the script writers query it several times per script.
+
         Returns:
             Executable: Instance of the appropriate executable handler
             (GaussianExecutable, ORCAExecutable, XTBExecutable, or
@@ -27,11 +27,28 @@ from chemsmart.io.gaussian.route import GaussianRoute
 from chemsmart.io.orca.route import ORCARoute
 from chemsmart.io.xtb.route import XTBRoute
 from chemsmart.utils.repattern import (
+    double_quoted_string_pattern,
     gaussian_date_pattern,
+    orca_cpcm_smd_true_pattern,
     orca_date_pattern,
+    orca_route_solvent_model_pattern,
+    orca_route_solvent_models,
+    orca_route_solvent_pattern,
+    orca_solventfilename_keyword_pattern,
     xtb_date_pattern,
 )
 
+# Compiled once at import: the ORCA solvent properties below scan every
+# line of the file.
+_ORCA_CPCM_SMD_TRUE_RE = re.compile(orca_cpcm_smd_true_pattern, re.IGNORECASE)
+_ORCA_ROUTE_SOLVENT_RE = re.compile(orca_route_solvent_pattern)
+_ORCA_ROUTE_SOLVENT_MODEL_RES = tuple(
+    (model, re.compile(orca_route_solvent_model_pattern.format(model=model)))
+    for model in orca_route_solvent_models
+)
+_SOLVENTFILENAME_RE = re.compile(orca_solventfilename_keyword_pattern)
+_QUOTED_STRING_RE = re.compile(double_quoted_string_pattern)
+
 
 class FileMixin:
     """
@@ -1093,22 +1110,15 @@ class ORCAFileMixin(FileMixin):
             str or None: One of ``"cpcm"``, ``"cpcmc"``, ``"smd"``,
             ``"cosmors"``, or ``None`` if no solvent model is found.
         """
-        cpcm = False
-        smd = False
-
         for i, line in enumerate(self.contents):
             # solvent specification in the %cpcm block (old-style ORCA)
             if "%cpcm" in line.lower():
-                cpcm = True
-                next_lines = self.contents[i + 1 :]
-                for _, next_line in enumerate(next_lines):
-                    if re.search(r"\bsmd\s+true\b", next_line, re.IGNORECASE):
-                        smd = True
-
-        if cpcm:
-            if smd:
-                return "smd"
-            return "cpcm"
+                if any(
+                    _ORCA_CPCM_SMD_TRUE_RE.search(next_line)
+                    for next_line in self.contents[i + 1 :]
+                ):
+                    return "smd"
+                return "cpcm"
 
         # Fallback: detect ORCA 6.0 style keyword from the route line.
         # Check in priority order (most specific first).
@@ -1118,14 +1128,9 @@ class ORCAFileMixin(FileMixin):
             )
         except NotImplementedError:
             route_lower = ""
-        if re.search(r"\bcosmors\b", route_lower):
-            return "cosmors"
-        if re.search(r"\bcpcmc\b", route_lower):
-            return "cpcmc"
-        if re.search(r"\bsmd\b", route_lower):
-            return "smd"
-        if re.search(r"\bcpcm\b", route_lower):
-            return "cpcm"
+        for model, model_re in _ORCA_ROUTE_SOLVENT_MODEL_RES:
+            if model_re.search(route_lower):
+                return model
         return None
 
     @property
@@ -1148,11 +1153,11 @@ class ORCAFileMixin(FileMixin):
             if line.startswith("Solvent name"):
                 return line.split()[-1]
         for line in self.contents:
-            if "solvent" in line.lower() and not re.search(
-                r"\bsolventfilename\b", line.lower()
+            line_lower = line.lower()
+            if "solvent" in line_lower and not _SOLVENTFILENAME_RE.search(
+                line_lower
             ):
-                pattern = re.compile(r'"([^"]*)"')
-                matches = pattern.findall(line.lower())
+                matches = _QUOTED_STRING_RE.findall(line_lower)
                 if len(matches) == 1:
                     return matches[0]
                 raise Exception(
@@ -1167,7 +1172,7 @@ class ORCAFileMixin(FileMixin):
             )
         except NotImplementedError:
             route_lower = ""
-        m = re.search(r"\b(?:cosmors|cpcmc|smd|cpcm)\(([^)]+)\)", route_lower)
+        m = _ORCA_ROUTE_SOLVENT_RE.search(route_lower)
         if m:
             return m.group(1)
         return None
@@ -1622,16 +1627,18 @@ class YAMLFileMixin(FileMixin):
         """
         Parse YAML file contents into a Python object.
 
-        Uses `yaml.safe_load` to read the YAML root (typically a mapping).
-        The return type depends on the file contents: dict (common), list,
-        scalar, or None for empty files.
+        Uses PyYAML's safe loader to read the YAML root (typically a
+        mapping), preferring the libyaml-backed `CSafeLoader` when PyYAML
+        was built with it. The return type depends on the file contents:
+        dict (common), list, scalar, or None for empty files.
 
         Returns:
             Any: Parsed YAML root object.
         """
         import yaml
 
-        return yaml.safe_load(self.content_lines_string)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(self.content_lines_string, Loader=loader)
 
     @property
     def yaml_contents_keys(self):
@@ -1679,7 +1686,8 @@ class RegistryMeta(type):
     """
     Metaclass that seeds a shared subclass registry on the root class.
 
-    Initializes a `_REGISTRY` list on the first (root) class in a hierarchy.
+    Initializes a `_REGISTRY` list on the first (root) class in a hierarchy,
+    together with a `_SUBCLASSES_CACHE` dict memoizing `subclasses()`.
     Actual automatic registration of subclasses happens in
     `RegistryMixin.__init_subclass__`, which appends new subclasses to
     the root's `_REGISTRY` when `REGISTERABLE` is True.
@@ -1698,6 +1706,7 @@ class RegistryMeta(type):
         # Only initialize _REGISTRY in the root parent class
         if not hasattr(cls, "_REGISTRY"):
             cls._REGISTRY = []
+            cls._SUBCLASSES_CACHE = {}
 
 
 class RegistryMixin(metaclass=RegistryMeta):
@@ -1724,7 +1733,16 @@ class RegistryMixin(metaclass=RegistryMeta):
         Returns:
             list: List of subclass types.
         """
-        return cls._subclasses(cls, cls._REGISTRY, allow_abstract)
+        # Runner/job dispatch calls this for every job; the filtered result
+        # only changes when a new subclass is registered.
+        key = (cls, allow_abstract)
+        subclasses = cls._SUBCLASSES_CACHE.get(key)
+        if subclasses is None:
+            subclasses = tuple(
+                cls._subclasses(cls, cls._REGISTRY, allow_abstract)
+            )
+            cls._SUBCLASSES_CACHE[key] = subclasses
+        return list(subclasses)
 
     @staticmethod
     def _subclasses(parent_cls, registry, allow_abstract):
@@ -1761,6 +1779,7 @@ class RegistryMixin(metaclass=RegistryMeta):
         if cls.REGISTERABLE:
             # Append the subclass to the root _REGISTRY
             cls._REGISTRY.append(cls)
+            cls._SUBCLASSES_CACHE.clear()
 
 
 # class BlockMixin:
@@ -1825,39 +1844,33 @@ class FolderMixin:
                 f"Supported programs: {valid_programs}."
             )
 
+        if program is None:
+            suffixes = ALL_SUFFIXES
+        else:
+            suffixes = tuple(PROGRAM_INFO[program]["suffixes"])
+
+        # Filter by suffix before touching the filesystem, so only
+        # candidate files are stat'ed; skip directories and empty files.
         candidate_files = []
         if recursive:
             for subdir, _dirs, files in os.walk(self.folder):
                 for file in files:
+                    if not file.endswith(suffixes):
+                        continue
                     filepath = os.path.join(subdir, file)
-                    # Skip directories and empty files
                     if not os.path.isfile(filepath):
                         continue
                     if os.stat(filepath).st_size == 0:
                         continue
-                    if program is None:
-                        if file.endswith(ALL_SUFFIXES):
-                            candidate_files.append(filepath)
-                    else:
-                        if file.endswith(
-                            tuple(PROGRAM_INFO[program]["suffixes"])
-                        ):
-                            candidate_files.append(filepath)
+                    candidate_files.append(filepath)
         else:
-            for file in os.listdir(self.folder):
-                filepath = os.path.join(self.folder, file)
-                # Skip directories and empty files
-                if not os.path.isfile(filepath):
-                    continue
-                if os.stat(filepath).st_size == 0:
-                    continue
-                # Filter by suffix first for efficiency
-                if program is None:
-                    if file.endswith(ALL_SUFFIXES):
-                        candidate_files.append(filepath)
-                else:
-                    if file.endswith(tuple(PROGRAM_INFO[program]["suffixes"])):
-                        candidate_files.append(filepath)
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(suffixes):
+                        continue
+                    if not entry.is_file() or entry.stat().st_size == 0:
+                        continue
+                    candidate_files.append(entry.path)
 
         matched_files = []
         for filepath in candidate_files:
@@ -1956,13 +1969,11 @@ class FolderMixin:
             list[str]: Full file paths matching the suffix.
         """
         all_files = []
-        for file in os.listdir(self.folder):
-            # Check that the file is not empty:
-            if os.stat(os.path.join(self.folder, file)).st_size == 0:
-                continue
-            # Collect files of specified type
-            if file.endswith(filetype):
-                all_files.append(os.path.join(self.folder, file))
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                # Collect non-empty files of specified type
+                if entry.name.endswith(filetype) and entry.stat().st_size:
+                    all_files.append(entry.path)
         return all_files
 
     def get_all_files_in_current_folder_and_subfolders_by_suffix(
@@ -2006,16 +2017,16 @@ class FolderMixin:
         from chemsmart.utils.io import get_program_type_from_file
 
         all_files = []
-        for file in os.listdir(self.folder):
-            filepath = os.path.join(self.folder, file)
-            # Check that the file is not empty:
-            if not os.path.isfile(filepath) or os.stat(filepath).st_size == 0:
-                continue
-            # Collect files of specified type and program
-            if file.endswith(filetype):
-                detected_program = get_program_type_from_file(filepath)
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                # Collect non-empty files of specified type and program
+                if not entry.name.endswith(filetype):
+                    continue
+                if not entry.is_file() or entry.stat().st_size == 0:
+                    continue
+                detected_program = get_program_type_from_file(entry.path)
                 if detected_program == program:
-                    all_files.append(filepath)
+                    all_files.append(entry.path)
         return all_files
 
     def get_all_files_in_current_folder_and_subfolders_by_program_and_suffix(
@@ -2063,11 +2074,12 @@ class FolderMixin:
         Returns:
             list[str]: Full file paths whose basenames match the pattern.
         """
+        pattern = re.compile(regex)
         all_files = []
         for subdir, _dirs, files in os.walk(self.folder):
             # subdir is the full path to the subdirectory
             for file in files:
-                if re.match(regex, file):
+                if pattern.match(file):
                     all_files.append(os.path.join(subdir, file))
         return all_files
 
@@ -2086,12 +2098,11 @@ class FolderMixin:
         Returns:
             list[str]: Full file paths whose basenames match the pattern.
         """
+        pattern = re.compile(regex)
         all_files = []
-        for file in os.listdir(self.folder):
-            # check that the file is not empty:
-            if os.stat(os.path.join(self.folder, file)).st_size == 0:
-                continue
-            # collect files of specified type
-            if re.match(regex, file):
-                all_files.append(os.path.join(self.folder, file))
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                # collect non-empty files matching the pattern
+                if pattern.match(entry.name) and entry.stat().st_size:
+                    all_files.append(entry.path)
         return all_files
@@ -28,6 +28,23 @@ allxyz_filename_pattern = r"([^\s\"']+\.allxyz\b)"
 # .cosmorsxyz file (name + ".cosmorsxyz") and copy it to scratch.
 solventfilename_block_pattern = r'(?i)solventfilename\s+"([^"]+)"'
 
+# Pattern to match ORCA temporary scratch files that should not be copied
+# back to the job folder, e.g. job.tmp, job.tmp.0, job.densities.tmp.12
+orca_tmp_filename_pattern = r"\.tmp(?:\.[^/]*)?$"
+
+# ORCA implicit solvation: "smd true" inside a %cpcm block, and the
+# ORCA 6 route-line form MODEL(solvent), e.g. cpcm(water), smd(toluene)
+orca_cpcm_smd_true_pattern = r"\bsmd\s+true\b"
+# Route-line solvent model keywords, most specific first
+orca_route_solvent_models = ("cosmors", "cpcmc", "smd", "cpcm")
+orca_route_solvent_pattern = (
+    rf"\b(?:{'|'.join(orca_route_solvent_models)})\(([^)]+)\)"
+)
+# Whole-word match of a single solvent model keyword; fill in {model}
+orca_route_solvent_model_pattern = r"\b{model}\b"
+orca_solventfilename_keyword_pattern = r"\bsolventfilename\b"
+double_quoted_string_pattern = r'"([^"]*)"'
+
 normal_mode_pattern = r"\s*(\d+)\s+(\d+)((?:\s+[+-]?\d*\.\d+)+)\s*"
 frozen_coordinates_pattern = (
     r"\s*([A-Z][a-z]?)\s+(-1|0)\s+(-?\d+\.\d*)\s+(-?\d+\.\d*)\s+(-?\d+\.\d*)"
@@ -1,6 +1,9 @@
+import logging
 from pathlib import Path
 
+from chemsmart.io.xtb import XTB_ALL_OPT_LEVELS
 from chemsmart.jobs.xtb.opt import XTBOptJob
+from chemsmart.jobs.xtb.runner import FakeXTBJobRunner, XTBJobRunner
 from chemsmart.jobs.xtb.settings import XTBJobSettings
 
 
@@ -43,3 +46,223 @@ class TestXTBJobs:
         assert f"--input {job.label}.inp" in out
         assert "--gfn 2" in out
         assert "--alpb water" in out
+
+    def test_opt_job_in_scratch_copies_files_back(
+        self, temporary_working_dir, water_molecule, pbs_server
+    ):
+        scratch_dir = temporary_working_dir / "scratch"
+        scratch_dir.mkdir()
+        jobrunner = FakeXTBJobRunner(
+            server=pbs_server, scratch=True, scratch_dir=str(scratch_dir)
+        )
+        settings = XTBJobSettings(
+            charge=0,
+            multiplicity=1,
+            jobtype="opt",
+            constraints=[[1, 2]],
+        )
+        job = XTBOptJob(
+            molecule=water_molecule,
+            settings=settings,
+            label="water_opt_scratch",
+            jobrunner=jobrunner,
+        )
+        assert jobrunner.run(job) == 0
+
+        scratch_folder = Path(jobrunner.running_directory)
+        assert scratch_folder != Path(job.folder)
+        assert (scratch_folder / f"{job.label}.xyz").is_file()
+
+        folder = Path(job.folder)
+        assert (folder / f"{job.label}.xyz").is_file()
+        assert (folder / f"{job.label}.inp").is_file()
+        assert (folder / f"{job.label}.out").is_file()
+
+        # the job folder keeps an independent copy of the scratch files
+        job_xyz = folder / f"{job.label}.xyz"
+        scratch_xyz = scratch_folder / f"{job.label}.xyz"
+        assert not job_xyz.samefile(scratch_xyz)
+        original = job_xyz.read_text()
+        scratch_xyz.write_text("rewritten in scratch\n")
+        assert job_xyz.read_text() == original
+
+    def test_opt_job_moves_files_when_scratch_is_deleted(
+        self, temporary_working_dir, water_molecule, pbs_server
+    ):
+        scratch_dir = temporary_working_dir / "scratch"
+        scratch_dir.mkdir()
+        jobrunner = FakeXTBJobRunner(
+            server=pbs_server,
+            scratch=True,
+            scratch_dir=str(scratch_dir),
+            delete_scratch=True,
+        )
+        settings = XTBJobSettings(charge=0, multiplicity=1, jobtype="opt")
+        job = XTBOptJob(
+            molecule=water_molecule,
+            settings=settings,
+            label="water_opt_delete_scratch",
+            jobrunner=jobrunner,
+        )
+        assert jobrunner.run(job) == 0
+
+        folder = Path(job.folder)
+        assert (folder / f"{job.label}.xyz").is_file()
+        assert (folder / f"{job.label}.out").is_file()
+        assert not Path(jobrunner.running_directory).exists()
+
+    def test_failed_copy_keeps_scratch(
+        self, temporary_working_dir, water_molecule, pbs_server, mocker
+    ):
+        scratch_dir = temporary_working_dir / "scratch"
+        scratch_dir.mkdir()
+        jobrunner = FakeXTBJobRunner(
+            server=pbs_server,
+            scratch=True,
+            scratch_dir=str(scratch_dir),
+            delete_scratch=True,
+        )
+        copy_file = XTBJobRunner._copy_file_to_job_folder
+
+        def fail_for_xyz(filepath, folder, move=False):
+            if filepath.endswith(".xyz"):
+                raise OSError("disk full")
+            return copy_file(filepath, folder, move=move)
+
+        mocker.patch.object(
+            XTBJobRunner, "_copy_file_to_job_folder", side_effect=fail_for_xyz
+        )
+        settings = XTBJobSettings(charge=0, multiplicity=1, jobtype="opt")
+        job = XTBOptJob(
+            molecule=water_molecule,
+            settings=settings,
+            label="water_opt_failed_copy",
+            jobrunner=jobrunner,
+        )
+        assert jobrunner.run(job) == 0
+
+        scratch_folder = Path(jobrunner.running_directory)
+        assert (scratch_folder / f"{job.label}.xyz").is_file()
+        assert not (Path(job.folder) / f"{job.label}.xyz").exists()
+
+
+class TestXTBJobSettings:
+    def test_copy_is_equal_and_independent(self):
+        settings = XTBJobSettings(
+            charge=0,
+            multiplicity=1,
+            jobtype="opt",
+            solvent_model="alpb",
+            solvent_id="water",
+            constraints=[[1, 2], [1, 2, 3]],
+        )
+        copied = settings.copy()
+        assert copied == settings
+        assert copied is not settings
+
+        copied.constraints[0].append(4)
+        copied.charge = 1
+        assert settings.constraints == [[1, 2], [1, 2, 3]]
+        assert settings.charge == 0
+
+    def test_default_returns_independent_copies(self):
+        settings = XTBJobSettings.default()
+        assert settings == XTBJobSettings()
+
+        settings.charge = 1
+        settings.jobtype = "opt"
+        other = XTBJobSettings.default()
+        assert other is not settings
+        assert other.charge is None
+        assert other.jobtype is None
+
+    def test_merge_settings_matches_dict_merge(self):
+        settings = XTBJobSettings(
+            jobtype="opt", solvent_model="alpb", solvent_id="water"
+        )
+        other = XTBJobSettings(
+            charge=1, multiplicity=2, title="other", constraints=[[1, 2]]
+        )
+
+        merged = settings.merge(other)
+        assert merged == settings.merge(other.to_dict())
+        assert merged.charge == 1
+        assert merged.jobtype == "opt"
+
+        merged_all = settings.merge(other, merge_all=True)
+        assert merged_all == settings.merge(other.to_dict(), merge_all=True)
+        merged_all.constraints[0].append(3)
+        assert other.constraints == [[1, 2]]
+
+    def test_equal_settings_hash_equal(self):
+        settings = XTBJobSettings(
+            charge=0, multiplicity=1, jobtype="opt", constraints=[[1, 2]]
+        )
+        other = XTBJobSettings(
+            charge=0, multiplicity=1, jobtype="opt", constraints=[[1, 2]]
+        )
+        assert settings == other
+        assert hash(settings) == hash(other)
+        assert len({settings, other}) == 1
+
+        other.charge = 1
+        assert settings != other
+
+    def test_to_dict_round_trip(self):
+        settings = XTBJobSettings(charge=1, multiplicity=2, jobtype="sp")
+        assert not hasattr(settings, "__dict__")
+        assert XTBJobSettings(**settings.to_dict()) == settings
+
+    def test_get_command_args(self):
+        settings = XTBJobSettings(
+            gfn_version="gfn2",
+            charge=-1,
+            multiplicity=2,
+            jobtype="opt",
+            optimization_level="tight",
+            freq=True,
+            solvent_model="alpb",
+            solvent_id="water",
+            additional_flags="--cycles 50",
+        )
+        assert settings.get_command_args() == [
+            "--gfn",
+            "2",
+            "--ohess",
+            "tight",
+            "--chrg",
+            "-1",
+            "--uhf",
+            "1",
+            "--alpb",
+            "water",
+            "--cycles",
+            "50",
+        ]
+        assert settings.get_command_args(input_filename="job.inp")[-4:] == [
+            "--input",
+            "job.inp",
+            "--cycles",
+            "50",
+        ]
+
+        # returned lists are independent of the cached result
+        settings.get_command_args().append("--grad")
+        assert "--grad" not in settings.get_command_args()
+
+    def test_get_command_args_distinguishes_int_and_float_charge(self):
+        for charges in ((1.0, 1), (1, 1.0)):
+            rendered = [
+                XTBJobSettings(
+                    charge=charge, multiplicity=2, jobtype="sp"
+                ).get_command_args()
+                for charge in charges
+            ]
+            assert [args[args.index("--chrg") + 1] for args in rendered] == [
+                str(charge) for charge in charges
+            ]
+
+    def test_unknown_value_warning_keeps_reference_order(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            XTBJobSettings(optimization_level="medium")
+        assert str(XTB_ALL_OPT_LEVELS) in caplog.text
@@ -37,6 +37,8 @@ from chemsmart.database.utils import (
     to_json,
     truncate_iso,
 )
+from chemsmart.io.database import DatabaseFile
+from chemsmart.io.molecules.structure import Molecule
 
 # Canonical InChIKeys (molecule_id) for molecules used across the test suite
 INCHIKEY_H2O = "XLYOFNOQVPJJNP-UHFFFAOYSA-N"
@@ -357,6 +359,10 @@ class TestDatabaseUtilities:
         obj2 = from_json(json_str)
         assert obj2 == {"a": 1, "b": 2}
         assert from_json(None) is None
+        obj3 = {"energy": float("nan"), "positions": [[0.0, 1.5, -2.25]]}
+        obj4 = from_json(to_json(obj3))
+        assert np.isnan(obj4["energy"])
+        assert obj4["positions"] == [[0.0, 1.5, -2.25]]
 
     def test_format(self):
         assert format_kv("Energy", None, 10) == "  Energy    : NULL"
@@ -1230,6 +1236,27 @@ class TestStaticDatabaseContent:
         assert db.count_molecules() == 33
         assert db.count_structures() == 314
 
+    def test_read_molecules_reuses_cached_parse(
+        self, database_chemsmart_file, mocker
+    ):
+        """Repeat reads of an unchanged database are served from the cache."""
+        get_all_molecules = mocker.spy(DatabaseFile, "get_all_molecules")
+        first = Molecule.from_filepath(
+            database_chemsmart_file, index=":", return_list=True
+        )
+        num_queries = get_all_molecules.call_count
+        second = Molecule.from_filepath(
+            database_chemsmart_file, index=":", return_list=True
+        )
+        assert get_all_molecules.call_count == num_queries
+        assert len(first) == len(second) == 314
+        assert first is not second
+        for mol1, mol2 in zip(first, second):
+            assert mol1.chemical_symbols == mol2.chemical_symbols
+            assert np.array_equal(mol1.positions, mol2.positions)
+            assert mol1.charge == mol2.charge
+        assert first[0].positions.dtype == np.float64
+
     def test_program_distribution(self, database_chemsmart_file):
         """36 Gaussian records and 11 ORCA records are present."""
         db = Database(database_chemsmart_file)
@@ -234,6 +234,17 @@ class TestRegistryMixin:
         assert SubRegistry1 in subclasses
         assert SubRegistry2 in subclasses
 
+    def test_subclasses_cache_sees_new_subclasses(self):
+        first = BaseRegistry.subclasses()
+        first.clear()
+        assert SubRegistry1 in BaseRegistry.subclasses()
+
+        class LateSubRegistry(BaseRegistry):
+            pass
+
+        assert LateSubRegistry in BaseRegistry.subclasses()
+        assert LateSubRegistry not in SubRegistry1.subclasses()
+
 
 class DummyFolder(FolderMixin):
     def __init__(self, folder):
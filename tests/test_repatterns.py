@@ -8,6 +8,9 @@ from chemsmart.utils.repattern import (
     gaussian_freq_keywords_pattern,
     gaussian_opt_keywords_pattern,
     multiple_spaces_pattern,
+    orca_cpcm_smd_true_pattern,
+    orca_route_solvent_pattern,
+    orca_tmp_filename_pattern,
 )
 
 
@@ -91,6 +94,33 @@ def test_multiple_spaces_pattern():
     ), "Should match: trailing spaces"
 
 
+def test_orca_tmp_filename_pattern():
+    """Test pattern for matching ORCA temporary scratch files."""
+    pattern = re.compile(orca_tmp_filename_pattern)
+
+    assert pattern.search("/scratch/job.tmp") is not None
+    assert pattern.search("/scratch/job.tmp.0") is not None
+    assert pattern.search("/scratch/job.densities.tmp.12") is not None
+    assert pattern.search("/scratch/job.out") is None
+    assert pattern.search("/scratch/job.tmpfile") is None
+    assert pattern.search("/scratch/job.tmp.d/job.out") is None
+
+
+def test_orca_solvent_patterns():
+    """Test patterns for ORCA %cpcm SMD flags and route-line solvents."""
+    smd_true = re.compile(orca_cpcm_smd_true_pattern, re.IGNORECASE)
+    assert smd_true.search("  SMD TRUE") is not None
+    assert smd_true.search("smd   true") is not None
+    assert smd_true.search("smd false") is None
+    assert smd_true.search('smdsolvent "water"') is None
+
+    route_solvent = re.compile(orca_route_solvent_pattern)
+    assert route_solvent.search("! b3lyp cpcm(water)").group(1) == "water"
+    assert route_solvent.search("! smd(toluene) opt").group(1) == "toluene"
+    assert route_solvent.search("! cpcmc(thf)").group(1) == "thf"
+    assert route_solvent.search("! b3lyp cpcm opt") is None
+
+
 def test_gaussian_route_string_cleaning_patterns():
     """Test comprehensive route string cleaning with all three patterns."""
     test_route = "# b3lyp/6-31g(d)  opt=(calcfc,tight,maxstep=5)   freq=numer   scrf=(smd)  scf=qc"
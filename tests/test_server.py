@@ -129,3 +129,24 @@ conda activate ~/anaconda3/envs/chemsmart
         buffer = StringIO()
         submitter._write_scheduler_options(buffer)
         assert "#PBS -m abe\n" in buffer.getvalue()
+
+    def test_submitter_caches_executable(self, mocker):
+        server = Server("custom-slurm", SCHEDULER="SLURM")
+        job = type("DummyJob", (), {"label": "job1", "PROGRAM": "gaussian"})()
+        from_servername = mocker.patch.object(
+            GaussianExecutable, "from_servername"
+        )
+        submitter = SLURMSubmitter(job=job, server=server)
+
+        assert submitter.executable is submitter.executable
+        from_servername.assert_called_once_with("custom-slurm")
+
+    def test_slurm_array_directive_uses_number_of_jobs(self):
+        server = Server("custom-slurm", SCHEDULER="SLURM", NUM_GPUS=0)
+        job = type("DummyJob", (), {"label": "job1"})()
+        submitter = SLURMSubmitter(job=job, server=server)
+        submitter.jobs = [job] * 5
+
+        buffer = StringIO()
+        submitter._write_array_scheduler_options(buffer, num_nodes=2)
+        assert "#SBATCH --array=1-5%2\n" in buffer.getvalue()
@@ -465,6 +465,20 @@ class TestStructures:
         )
         assert isinstance(molecule, Molecule)
 
+    def test_xyz_file_only_parses_selected_frames(
+        self, multiple_molecules_xyz_file, mocker
+    ):
+        spy = mocker.spy(Molecule, "from_coordinate_block_text")
+        xyz_file = XYZFile(filename=multiple_molecules_xyz_file)
+
+        last_mol = xyz_file.get_molecules(index="-1")
+        assert spy.call_count == 1
+        assert last_mol.structure_index_in_file == 18
+
+        molecules = xyz_file.get_molecules(index="2:4", return_list=True)
+        assert spy.call_count == 3
+        assert [m.structure_index_in_file for m in molecules] == [2, 3]
+
     def test_molecular_geometry(self):
         """Test molecular geometry calculations."""
         mol = Molecule(
@@ -1099,6 +1113,35 @@ class TestMoleculeAdvanced:
             assert "HETATM" in content or "ATOM" in content
             assert "END" in content
 
+    def test_write_xyz_frames_matches_appended_writes(
+        self, multiple_molecules_xyz_file, tmpdir
+    ):
+        """Test writing several molecules as frames of one XYZ file."""
+        molecules = Molecule.from_filepath(
+            multiple_molecules_xyz_file, index=":", return_list=True
+        )
+        assert len(molecules) > 1
+
+        frames_file = os.path.join(tmpdir, "frames.xyz")
+        Molecule.write_xyz_frames(molecules, frames_file)
+
+        appended_file = os.path.join(tmpdir, "appended.xyz")
+        for molecule in molecules:
+            molecule.write_xyz(appended_file, mode="a")
+
+        with open(frames_file) as f:
+            frames_content = f.read()
+        with open(appended_file) as f:
+            appended_content = f.read()
+        assert frames_content == appended_content.replace(
+            "appended.xyz", "frames.xyz"
+        )
+
+        reread = Molecule.from_filepath(
+            frames_file, index=":", return_list=True
+        )
+        assert len(reread) == len(molecules)
+
     def test_write_generic_method_with_pdb_format(
         self, single_molecule_xyz_file, tmpdir
     ):